@@ -3,55 +3,210 @@ Azure authentication and client initialization
 """
 
 import logging
-from typing import Optional
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
 
+import requests
+from azure.core.credentials import AccessToken, TokenCredential
 from azure.core.exceptions import ClientAuthenticationError
+from azure.core.pipeline.transport import RequestsTransport
+from azure.core.rest import HttpRequest, HttpResponse
 from azure.identity import DefaultAzureCredential
 from azure.mgmt.resource import ManagementLockClient
+from requests.adapters import HTTPAdapter
 
 from .exceptions import AuthenticationError, AzureClientError
+from .policies import (
+    CircuitBreaker,
+    CircuitBreakerPolicy,
+    JitteredRetryPolicy,
+    RateLimitPolicy,
+    TokenBucket,
+)
+
+# Retries are handled by the Azure Core pipeline retry policy, which honors
+# server Retry-After headers and retries at the transport layer without
+# re-running the calling code. Backoff is jittered (see policies.py).
+RETRY_SETTINGS = {
+    "retry_total": 3,
+    "retry_backoff_factor": 1.0,
+    "retry_backoff_max": 60,
+    "retry_on_status_codes": [408, 429, 500, 502, 503, 504],
+}
+
+# Keep-alive connections per host; sized so every worker of the concurrent
+# removal gets its own connection instead of queueing on the default pool of 10
+POOL_SIZE = 64
+
+# Token scope used by the ARM clients
+ARM_SCOPE = "https://management.azure.com/.default"
+
+# Cached access tokens are refreshed this many seconds before they expire
+TOKEN_REFRESH_MARGIN = 300
+
+# Process-wide credential and per-subscription clients, so repeated
+# AzureAuthManager instances reuse the credential chain probe and the HTTP
+# connection pool instead of rebuilding them.
+_CREDENTIAL: Optional["CachedTokenCredential"] = None
+_CLIENT_CACHE: Dict[
+    Tuple[str, Optional[float]], Tuple[ManagementLockClient, CircuitBreaker]
+] = {}
+_CACHE_LOCK = threading.Lock()
+
+
+def _build_transport() -> RequestsTransport:
+    """Build a requests transport with a connection pool sized for concurrency."""
+    session = requests.Session()
+    # Retries are left to the pipeline RetryPolicy
+    adapter = HTTPAdapter(
+        pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE, max_retries=0
+    )
+    session.mount("https://", adapter)
+    return RequestsTransport(session=session, session_owner=False)
+
+
+class CachedTokenCredential:
+    """
+    Token credential that reuses access tokens across clients.
+
+    Tokens are cached per scope and returned until ``TOKEN_REFRESH_MARGIN``
+    seconds before they expire, so new clients skip the credential chain
+    instead of probing it again for every token request.
+    """
+
+    def __init__(self, credential: TokenCredential):
+        """
+        Initialize the cached credential.
+
+        Args:
+            credential: Credential used to acquire tokens on a cache miss
+        """
+        self._credential = credential
+        self._tokens: Dict[Tuple[Any, ...], AccessToken] = {}
+        self._lock = threading.Lock()
+
+    def get_token(self, *scopes: str, **kwargs: Any) -> AccessToken:
+        """
+        Get an access token for the given scopes.
+
+        Requests carrying claims (a CAE challenge) always go to the wrapped
+        credential, since the cached token has just been rejected.
+        """
+        if kwargs.get("claims"):
+            return self._credential.get_token(*scopes, **kwargs)
+
+        key = (scopes, tuple(sorted(kwargs.items())))
+        with self._lock:
+            token = self._tokens.get(key)
+            if token is None or token.expires_on - TOKEN_REFRESH_MARGIN <= time.time():
+                token = self._credential.get_token(*scopes, **kwargs)
+                self._tokens[key] = token
+            return token
+
+    def close(self) -> None:
+        """Close the wrapped credential."""
+        self._credential.close()
 
 
 class AzureAuthManager:
     """Handles Azure authentication and client initialization."""
 
-    def __init__(self, subscription_id: str):
+    def __init__(self, subscription_id: str, rate_limit: Optional[float] = None):
         """
         Initialize the authentication manager.
 
         Args:
             subscription_id: Azure subscription ID
+            rate_limit: Maximum write requests per minute, or None for no limit
         """
         self.subscription_id = subscription_id
+        self.rate_limit = rate_limit
         self.logger = logging.getLogger(__name__)
-        self._credential: Optional[DefaultAzureCredential] = None
+        self._credential: Optional[CachedTokenCredential] = None
         self._client: Optional[ManagementLockClient] = None
+        self._breaker: Optional[CircuitBreaker] = None
+        self._management_locks: Any = None
 
     @property
     def client(self) -> ManagementLockClient:
         """Get the initialized Management Lock client."""
+        # _initialize_client raises if the client cannot be created
         if self._client is None:
             self._initialize_client()
-        if self._client is None:
-            raise AzureClientError("Failed to initialize Azure client")
         return self._client
 
+    @property
+    def breaker(self) -> CircuitBreaker:
+        """Get the circuit breaker fed by the client's responses."""
+        if self._breaker is None:
+            self._initialize_client()
+        return self._breaker
+
+    @property
+    def management_locks(self) -> Any:
+        """
+        Get the Management Locks operations of the client.
+
+        The SDK builds a new operations object on every ``client.management_locks``
+        access, so it is resolved once and reused.
+        """
+        if self._management_locks is None:
+            self._management_locks = self.client.management_locks
+        return self._management_locks
+
+    def send_request(self, request: HttpRequest) -> HttpResponse:
+        """
+        Send a raw ARM request through the client's pipeline.
+
+        The request shares the client's authentication, retry policy and
+        connection pool.
+        """
+        return self.client._client.send_request(request)
+
+    def _per_retry_policies(self, breaker: CircuitBreaker) -> List[Any]:
+        """Build the policies run on every attempt of a request."""
+        policies: List[Any] = [CircuitBreakerPolicy(breaker)]
+        if self.rate_limit is not None:
+            policies.append(RateLimitPolicy(TokenBucket(self.rate_limit / 60)))
+        return policies
+
     def _initialize_client(self) -> None:
         """Initialize Azure Management Lock client with appropriate credentials."""
+        global _CREDENTIAL
+
         try:
-            # Use DefaultAzureCredential which handles multiple auth methods:
-            # 1. Managed Identity (when running on Azure)
-            # 2. Environment variables (service principal)
-            # 3. Azure CLI (if logged in)
-            # 4. Interactive browser (fallback)
-            self._credential = DefaultAzureCredential()
-
-            self._client = ManagementLockClient(
-                credential=self._credential, subscription_id=self.subscription_id
-            )
+            with _CACHE_LOCK:
+                # Use DefaultAzureCredential which handles multiple auth methods:
+                # 1. Managed Identity (when running on Azure)
+                # 2. Environment variables (service principal)
+                # 3. Azure CLI (if logged in)
+                # The interactive browser credential is excluded by default
+                if _CREDENTIAL is None:
+                    credential = CachedTokenCredential(DefaultAzureCredential())
+                    # Probe the credential chain now, so authentication fails
+                    # before any listing and concurrent workers find the token
+                    # already cached
+                    credential.get_token(ARM_SCOPE)
+                    _CREDENTIAL = credential
+                self._credential = _CREDENTIAL
+
+                cache_key = (self.subscription_id, self.rate_limit)
+                cached = _CLIENT_CACHE.get(cache_key)
+                if cached is None:
+                    breaker = CircuitBreaker()
+                    client = ManagementLockClient(
+                        credential=self._credential,
+                        subscription_id=self.subscription_id,
+                        transport=_build_transport(),
+                        retry_policy=JitteredRetryPolicy(**RETRY_SETTINGS),
+                        per_retry_policies=self._per_retry_policies(breaker),
+                    )
+                    cached = _CLIENT_CACHE[cache_key] = (client, breaker)
+                self._client, self._breaker = cached
 
             self.logger.info(
-                f"Initialized Azure client for subscription: {self.subscription_id}"
+                "Initialized Azure client for subscription: %s", self.subscription_id
             )
 
         except ClientAuthenticationError as e:
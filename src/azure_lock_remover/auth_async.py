@@ -0,0 +1,108 @@
+"""
+Async Azure authentication and client initialization
+"""
+
+import logging
+from typing import Any, List, Optional
+
+from azure.core.exceptions import ClientAuthenticationError
+from azure.identity.aio import DefaultAzureCredential
+from azure.mgmt.resource.locks.aio import ManagementLockClient
+
+from .auth import RETRY_SETTINGS
+from .exceptions import AuthenticationError, AzureClientError
+from .policies import (
+    AsyncJitteredRetryPolicy,
+    AsyncRateLimitPolicy,
+    CircuitBreaker,
+    CircuitBreakerPolicy,
+    TokenBucket,
+)
+
+
+class AsyncAzureAuthManager:
+    """Handles Azure authentication and async client initialization."""
+
+    def __init__(self, subscription_id: str, rate_limit: Optional[float] = None):
+        """
+        Initialize the async authentication manager.
+
+        Args:
+            subscription_id: Azure subscription ID
+            rate_limit: Maximum write requests per minute, or None for no limit
+        """
+        self.subscription_id = subscription_id
+        self.rate_limit = rate_limit
+        self.logger = logging.getLogger(__name__)
+        self._credential: Optional[DefaultAzureCredential] = None
+        self._client: Optional[ManagementLockClient] = None
+        self._management_locks: Any = None
+        # Circuit breaker fed by the client's responses
+        self.breaker = CircuitBreaker()
+
+    @property
+    def client(self) -> ManagementLockClient:
+        """Get the initialized async Management Lock client."""
+        # _initialize_client raises if the client cannot be created
+        if self._client is None:
+            self._initialize_client()
+        return self._client
+
+    @property
+    def management_locks(self) -> Any:
+        """
+        Get the async Management Locks operations of the client.
+
+        The SDK builds a new operations object on every ``client.management_locks``
+        access, so it is resolved once and reused.
+        """
+        if self._management_locks is None:
+            self._management_locks = self.client.management_locks
+        return self._management_locks
+
+    def _per_retry_policies(self) -> List[Any]:
+        """Build the policies run on every attempt of a request."""
+        policies: List[Any] = [CircuitBreakerPolicy(self.breaker)]
+        if self.rate_limit is not None:
+            policies.append(AsyncRateLimitPolicy(TokenBucket(self.rate_limit / 60)))
+        return policies
+
+    def _initialize_client(self) -> None:
+        """Initialize async Azure Management Lock client with appropriate credentials."""
+        try:
+            self._credential = DefaultAzureCredential()
+
+            self._client = ManagementLockClient(
+                credential=self._credential,
+                subscription_id=self.subscription_id,
+                retry_policy=AsyncJitteredRetryPolicy(**RETRY_SETTINGS),
+                per_retry_policies=self._per_retry_policies(),
+            )
+
+            self.logger.info(
+                "Initialized async Azure client for subscription: %s",
+                self.subscription_id,
+            )
+
+        except ClientAuthenticationError as e:
+            self.logger.error(f"Authentication failed: {e}")
+            raise AuthenticationError(f"Failed to authenticate with Azure: {e}") from e
+        except Exception as e:
+            self.logger.error(f"Failed to initialize Azure client: {e}")
+            raise AzureClientError(f"Failed to initialize Azure client: {e}") from e
+
+    async def close(self) -> None:
+        """Close the async client and credential, releasing their HTTP sessions."""
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+            self._management_locks = None
+        if self._credential is not None:
+            await self._credential.close()
+            self._credential = None
+
+    async def __aenter__(self) -> "AsyncAzureAuthManager":
+        return self
+
+    async def __aexit__(self, *exc_details) -> None:
+        await self.close()
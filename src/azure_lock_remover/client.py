@@ -3,9 +3,11 @@ Main client class for Azure Lock Remover
 """
 
 import logging
+from typing import Optional
 
 from .auth import AzureAuthManager
-from .operations import LockOperations
+from .auth_async import AsyncAzureAuthManager
+from .operations import DEFAULT_MAX_CONCURRENCY, LockOperations
 
 
 class AzureLockRemover:
@@ -16,21 +18,38 @@ class AzureLockRemover:
     with proper error handling, retry logic, and logging.
     """
 
-    def __init__(self, subscription_id: str, dry_run: bool = False):
+    def __init__(
+        self,
+        subscription_id: str,
+        dry_run: bool = False,
+        max_workers: int = 16,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        rate_limit: Optional[float] = None,
+    ):
         """
         Initialize the lock remover.
 
         Args:
             subscription_id: Azure subscription ID
             dry_run: If True, only list locks without removing them
+            max_workers: Maximum number of locks removed concurrently
+            max_concurrency: Maximum number of in-flight async deletions
+            rate_limit: Maximum write requests per minute, or None for no limit
         """
         self.subscription_id = subscription_id
         self.dry_run = dry_run
         self.logger = logging.getLogger(__name__)
 
         # Initialize components
-        self.auth_manager = AzureAuthManager(subscription_id)
-        self.operations = LockOperations(self.auth_manager, dry_run)
+        self.auth_manager = AzureAuthManager(subscription_id, rate_limit)
+        self.async_auth_manager = AsyncAzureAuthManager(subscription_id, rate_limit)
+        self.operations = LockOperations(
+            self.auth_manager,
+            dry_run,
+            max_workers,
+            async_auth_manager=self.async_auth_manager,
+            max_concurrency=max_concurrency,
+        )
 
     def list_locks(self):
         """List all management locks in the subscription."""
@@ -43,3 +62,23 @@ class AzureLockRemover:
     def remove_all_locks(self):
         """Remove all management locks in the subscription."""
         return self.operations.remove_all_locks()
+
+    def remove_all_locks_batched(self):
+        """Remove all management locks in the subscription using ARM batch requests."""
+        return self.operations.remove_all_locks_batched()
+
+    async def list_locks_async(self):
+        """List all management locks in the subscription using the async client."""
+        return await self.operations.list_locks_async()
+
+    async def remove_lock_async(self, lock):
+        """Remove a specific management lock using the async client."""
+        return await self.operations.remove_lock_async(lock)
+
+    async def remove_all_locks_async(self):
+        """Remove all management locks in the subscription using the async client."""
+        return await self.operations.remove_all_locks_async()
+
+    async def close_async(self):
+        """Close the async client, e.g. after using the single-lock async methods."""
+        await self.async_auth_manager.close()
@@ -2,32 +2,151 @@
 Azure Management Lock operations
 """
 
+import asyncio
 import logging
-from typing import List, Any
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from itertools import groupby, islice
+from typing import (
+    List,
+    Any,
+    AsyncIterator,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Set,
+    Tuple,
+)
 
 from azure.core.exceptions import HttpResponseError, ResourceNotFoundError
+from azure.core.rest import HttpRequest
 
 from .auth import AzureAuthManager
-from .parser import LockScopeParser
-from .retry import RetryManager
+from .auth_async import AsyncAzureAuthManager
+from .exceptions import AzureClientError
+from .parser import parse_lock_id, split_lock_id
+from .policies import RETRYABLE_STATUS_CODES
+
+ARM_ENDPOINT = "https://management.azure.com"
+BATCH_URL = f"{ARM_ENDPOINT}/batch?api-version=2020-06-01"
+LOCKS_API_VERSION = "2016-09-01"
+
+# Default number of in-flight deletions on the async path
+DEFAULT_MAX_CONCURRENCY = 64
+
+# Maximum number of sub-requests ARM accepts in a single batch request
+BATCH_SIZE = 20
+
+# Seconds to wait before re-sending throttled sub-requests whose responses
+# carry no Retry-After header, and the longest Retry-After honoured
+BATCH_RETRY_DELAY = 1.0
+BATCH_RETRY_DELAY_MAX = 60.0
+
+# Locks held per worker while they wait behind a running removal in the same
+# resource group, bounding memory during concurrent removal
+QUEUED_LOCKS_PER_WORKER = 32
+
+
+def _scope_key(lock: Any) -> str:
+    """Return the normalized scope of a lock, used to order locks by scope."""
+    return split_lock_id(lock.id)[0].lower()
+
+
+def _retry_after(item: Dict[str, Any]) -> Optional[float]:
+    """Read the Retry-After seconds of a batch sub-response, if any."""
+    for name, value in (item.get("headers") or {}).items():
+        if name.lower() == "retry-after":
+            try:
+                return max(float(value), 0.0)
+            except (TypeError, ValueError):
+                return None
+    return None
+
+
+def _resource_group_of(scope_key: str) -> str:
+    """Return the resource group of a normalized scope, or "" for the subscription."""
+    return scope_key.partition("/resourcegroups/")[2].partition("/")[0]
 
 
 class LockOperations:
     """Handles Azure management lock operations."""
 
-    def __init__(self, auth_manager: AzureAuthManager, dry_run: bool = False):
+    __slots__ = (
+        "auth_manager",
+        "dry_run",
+        "max_workers",
+        "async_auth_manager",
+        "max_concurrency",
+        "logger",
+        "_dispatch",
+        "_claimed_ids",
+        "_claimed_lock",
+    )
+
+    def __init__(
+        self,
+        auth_manager: AzureAuthManager,
+        dry_run: bool = False,
+        max_workers: int = 16,
+        async_auth_manager: Optional[AsyncAzureAuthManager] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ):
         """
         Initialize lock operations.
 
         Args:
             auth_manager: Azure authentication manager
             dry_run: If True, only simulate operations
+            max_workers: Maximum number of locks removed concurrently
+            async_auth_manager: Async authentication manager used by the
+                ``*_async`` operations
+            max_concurrency: Maximum number of in-flight async deletions
         """
         self.auth_manager = auth_manager
         self.dry_run = dry_run
+        self.max_workers = max_workers
+        self.async_auth_manager = async_auth_manager
+        self.max_concurrency = max_concurrency
         self.logger = logging.getLogger(__name__)
-        self.parser = LockScopeParser()
-        self.retry_manager = RetryManager()
+        # Delete call builder per scope type, as returned by parse_lock_id
+        self._dispatch: Dict[str, Callable[..., Callable[[], Any]]] = {
+            "resource_group": self._resource_group_delete_call,
+            "resource": self._resource_delete_call,
+            "subscription": self._subscription_delete_call,
+        }
+        # Lowercased IDs of locks removed or being removed during the current
+        # ``remove_all_locks*`` run, so a lock listed twice is only deleted
+        # once. None outside a run, so direct ``remove_lock`` calls are not
+        # deduplicated.
+        self._claimed_ids: Optional[Set[str]] = None
+        self._claimed_lock = threading.Lock()
+
+    def iter_locks(self) -> Iterator[Any]:
+        """
+        Iterate over all management locks in the subscription.
+
+        Locks are yielded as each page is fetched, so processing can start
+        before the whole listing has been retrieved.
+
+        Yields:
+            ManagementLockObject instances
+        """
+        self.logger.info("Retrieving management locks from subscription...")
+
+        try:
+            yield from self.auth_manager.management_locks.list_at_subscription_level()
+        except ResourceNotFoundError:
+            self.logger.warning("Subscription not found or no access")
+        except Exception:
+            self.logger.exception("Error while listing locks")
+            raise
 
     def list_locks(self) -> List[Any]:
         """
@@ -36,27 +155,9 @@ class LockOperations:
         Returns:
             List of ManagementLockObject instances
         """
-        try:
-            self.logger.info("Retrieving management locks from subscription...")
-
-            def _list_locks():
-                client = self.auth_manager.client
-                return list(client.management_locks.list_at_subscription_level())
-
-            locks = self.retry_manager.retry_with_backoff(_list_locks)
-            self.logger.info(f"Found {len(locks)} management locks")
-
-            return locks
-
-        except ResourceNotFoundError:
-            self.logger.warning("Subscription not found or no access")
-            return []
-        except HttpResponseError as e:
-            self.logger.error(f"HTTP error while listing locks: {e}")
-            raise
-        except Exception as e:
-            self.logger.error(f"Unexpected error while listing locks: {e}")
-            raise
+        locks = list(self.iter_locks())
+        self.logger.info("Found %d management locks", len(locks))
+        return locks
 
     def remove_lock(self, lock: Any) -> bool:
         """
@@ -68,117 +169,655 @@ class LockOperations:
         Returns:
             True if successful, False otherwise
         """
-        try:
-            lock_name = lock.name
-            lock_scope = lock.id.split("/providers/Microsoft.Authorization/locks/")[0]
+        lock_name = lock.name
 
-            if self.dry_run:
-                self.logger.info(
-                    f"[DRY RUN] Would remove lock: {lock_name} (scope: {lock_scope})"
+        if self.dry_run:
+            self.logger.info(
+                "[DRY RUN] Would remove lock: %s (id: %s)", lock_name, lock.id
+            )
+            return True
+
+        try:
+            if self.auth_manager.breaker.is_open():
+                self.logger.warning(
+                    "Circuit breaker open after repeated throttling, skipping lock %s",
+                    lock_name,
                 )
-                return True
+                return False
 
-            self.logger.info(f"Removing lock: {lock_name} (scope: {lock_scope})")
+            if not self._claim(lock):
+                self.logger.debug("Lock %s already removed, skipping", lock_name)
+                return True
 
-            def _delete_lock():
-                self._execute_delete_operation(lock_name, lock_scope)
+            self.logger.info("Removing lock: %s (id: %s)", lock_name, lock.id)
 
-            self.retry_manager.retry_with_backoff(_delete_lock)
-            self.logger.info(f"Successfully removed lock: {lock_name}")
+            self._execute_delete(lock)
+            self.logger.info("Successfully removed lock: %s", lock_name)
             return True
 
         except ResourceNotFoundError:
             self.logger.warning(
-                f"Lock {lock.name} not found (may have been removed already)"
+                "Lock %s not found (may have been removed already)", lock_name
             )
             return True
         except HttpResponseError as e:
+            self._release(lock)
             if e.status_code == 403:
                 self.logger.error(
-                    f"Insufficient permissions to remove lock: {lock.name}"
+                    "Insufficient permissions to remove lock: %s", lock_name
                 )
             else:
-                self.logger.error(f"HTTP error removing lock {lock.name}: {e}")
+                self.logger.error("HTTP error removing lock %s: %s", lock_name, e)
             return False
-        except Exception as e:
-            self.logger.error(f"Unexpected error removing lock {lock.name}: {e}")
+        except Exception:
+            self._release(lock)
+            self.logger.exception("Unexpected error removing lock %s", lock_name)
             return False
 
-    def _execute_delete_operation(self, lock_name: str, lock_scope: str) -> None:
-        """Execute the appropriate delete operation based on lock scope."""
-        scope_info = self.parser.parse_lock_scope(lock_scope)
-        client = self.auth_manager.client
+    def _claim(self, lock: Any) -> bool:
+        """
+        Claim a lock for removal.
 
-        if scope_info["type"] == "resource_group":
-            rg_name = scope_info["resource_group_name"]
-            self.logger.debug(
-                f"Deleting resource group lock: {lock_name} from RG: {rg_name}"
-            )
-            client.management_locks.delete_at_resource_group_level(
-                resource_group_name=rg_name, lock_name=lock_name
-            )
-        elif scope_info["type"] == "resource":
-            provider = scope_info["provider"]
-            resource_type = scope_info["resource_type"]
-            resource_name = scope_info["resource_name"]
-            self.logger.debug(
-                f"Deleting resource lock: {lock_name} from "
-                f"{provider}/{resource_type}/{resource_name}"
-            )
-            client.management_locks.delete_at_resource_level(
-                resource_group_name=scope_info["resource_group_name"],
-                resource_provider_namespace=scope_info["provider"],
-                parent_resource_path="",
-                resource_type=scope_info["resource_type"],
-                resource_name=scope_info["resource_name"],
-                lock_name=lock_name,
-            )
-        elif scope_info["type"] == "subscription":
-            self.logger.debug(f"Deleting subscription lock: {lock_name}")
-            client.management_locks.delete_at_subscription_level(lock_name=lock_name)
-        else:
-            raise ValueError(f"Unknown lock scope type: {scope_info['type']}")
+        Returns:
+            False if the lock was already removed or is being removed
+            during the current run
+        """
+        if self._claimed_ids is None:
+            return True
+        lock_id = lock.id.lower()
+        with self._claimed_lock:
+            if lock_id in self._claimed_ids:
+                return False
+            self._claimed_ids.add(lock_id)
+            return True
+
+    def _release(self, lock: Any) -> None:
+        """Release the claim on a lock whose removal failed."""
+        if self._claimed_ids is None:
+            return
+        with self._claimed_lock:
+            self._claimed_ids.discard(lock.id.lower())
+
+    @contextmanager
+    def _claim_scope(self) -> Iterator[None]:
+        """Track claimed lock IDs for the duration of one removal run."""
+        self._claimed_ids = set()
+        try:
+            yield
+        finally:
+            self._claimed_ids = None
+
+    def _execute_delete(self, lock: Any, management_locks: Any = None) -> Any:
+        """
+        Execute the appropriate delete operation based on the lock's scope.
+
+        The result of the SDK call is returned as-is, so passing the async
+        client's operations yields an awaitable.
+        """
+        return self._build_delete_call(lock, management_locks)()
+
+    def _build_delete_call(
+        self, lock: Any, management_locks: Any = None
+    ) -> Callable[[], Any]:
+        """
+        Build the SDK delete call for a lock.
+
+        The scope is parsed once from ``lock.id`` and bound into the returned
+        callable, so the call can be repeated without parsing again.
+
+        Args:
+            lock: ManagementLockObject to delete
+            management_locks: Management Locks operations to call; defaults
+                to those of the sync client
+
+        Returns:
+            Zero-argument callable performing the delete
+
+        Raises:
+            InvalidScopeError: If the lock ID cannot be parsed
+        """
+        scope = parse_lock_id(lock.id)
+        if management_locks is None:
+            management_locks = self.auth_manager.management_locks
+
+        build = self._dispatch.get(scope[0])
+        if build is None:
+            raise ValueError(f"Unknown lock scope type: {scope[0]}")
+        return build(management_locks, scope, lock.name)
+
+    def _resource_group_delete_call(
+        self, management_locks: Any, scope: Tuple[str, ...], lock_name: str
+    ) -> Callable[[], Any]:
+        """Build the delete call for a resource group scoped lock."""
+        _, rg_name = scope
+        self.logger.debug(
+            "Deleting resource group lock: %s from RG: %s", lock_name, rg_name
+        )
+        return partial(
+            management_locks.delete_at_resource_group_level,
+            resource_group_name=rg_name,
+            lock_name=lock_name,
+        )
+
+    def _resource_delete_call(
+        self, management_locks: Any, scope: Tuple[str, ...], lock_name: str
+    ) -> Callable[[], Any]:
+        """Build the delete call for a resource scoped lock."""
+        _, rg_name, provider, resource_type, resource_name = scope
+        self.logger.debug(
+            "Deleting resource lock: %s from %s/%s/%s",
+            lock_name,
+            provider,
+            resource_type,
+            resource_name,
+        )
+        return partial(
+            management_locks.delete_at_resource_level,
+            resource_group_name=rg_name,
+            resource_provider_namespace=provider,
+            parent_resource_path="",
+            resource_type=resource_type,
+            resource_name=resource_name,
+            lock_name=lock_name,
+        )
+
+    def _subscription_delete_call(
+        self, management_locks: Any, scope: Tuple[str, ...], lock_name: str
+    ) -> Callable[[], Any]:
+        """Build the delete call for a subscription scoped lock."""
+        self.logger.debug("Deleting subscription lock: %s", lock_name)
+        return partial(
+            management_locks.delete_at_subscription_level, lock_name=lock_name
+        )
+
+    def _process_lock(self, lock: Any) -> bool:
+        """Log and remove a single lock; used as the thread pool work item."""
+        self.logger.info("Processing lock: %s (Level: %s)", lock.name, lock.level)
+        return self.remove_lock(lock)
 
     def remove_all_locks(self) -> dict:
         """
         Remove all management locks in the subscription.
 
+        Locks are streamed from the paged listing into a thread pool, with a
+        bounded number of locks held at any time, so memory stays bounded
+        regardless of the number of locks. Locks in the same resource group
+        are removed one at a time. In dry-run mode the
+        locks are only logged, so no thread pool is started.
+
         Returns:
             Dictionary with operation summary
         """
-        try:
-            locks = self.list_locks()
+        if self.dry_run:
+            # Nothing is deleted, so there is no per-lock I/O to overlap
+            total = 0
+            for lock in self.iter_locks():
+                self._report_lock(lock)
+                total += 1
+            success_count = total
+        else:
+            with self._claim_scope():
+                total, success_count = self._process_concurrently(self.iter_locks())
+
+        if total == 0:
+            self.logger.info("No management locks found in subscription")
+            return {"total": 0, "success": 0, "failed": 0}
 
-            if not locks:
-                self.logger.info("No management locks found in subscription")
-                return {"total": 0, "success": 0, "failed": 0}
+        self.logger.info("Found %d management locks", total)
+        return self._summarize(total, success_count)
 
-            self.logger.info(f"Processing {len(locks)} locks...")
+    def _report_lock(self, lock: Any) -> None:
+        """Log a lock a dry run would remove, without parsing or deleting it."""
+        self.logger.info(
+            "[DRY RUN] Would remove lock: %s (level: %s)", lock.id, lock.level
+        )
 
-            success_count = 0
-            failure_count = 0
+    def _process_concurrently(self, locks: Iterable[Any]) -> Tuple[int, int]:
+        """
+        Process locks on a thread pool as they are produced.
 
-            for lock in locks:
-                self.logger.info(f"Processing lock: {lock.name} (Level: {lock.level})")
+        ARM serializes writes within a resource group and rejects concurrent
+        ones, so locks are bucketed by resource group (subscription-level
+        locks share one bucket). Each bucket removes its locks one at a time,
+        while different buckets run in parallel. At most ``max_workers``
+        buckets are active at a time, and at most
+        ``max_workers * QUEUED_LOCKS_PER_WORKER`` locks wait behind them, so a
+        large resource group does not keep other buckets from starting.
 
-                if self.remove_lock(lock):
-                    success_count += 1
+        Returns:
+            Tuple of (total, success_count)
+        """
+        total = 0
+        success_count = 0
+        max_queued = self.max_workers * QUEUED_LOCKS_PER_WORKER
+        queued = 0
+        # Locks waiting behind the running removal of each active bucket
+        buckets: Dict[str, Deque[Any]] = {}
+        # Reentrant, so a callback that runs inline from submit can take it
+        buckets_changed = threading.Condition(threading.RLock())
+        # Set when intake stops early, so callbacks stop submitting
+        stopped = False
+
+        def submit(bucket: str, lock: Any) -> None:
+            future = executor.submit(self._process_lock, lock)
+            future.add_done_callback(partial(on_done, bucket))
+
+        def on_done(bucket: str, future: Future) -> None:
+            nonlocal success_count, queued
+            # remove_lock logs and absorbs its own errors; anything that still
+            # escapes counts as a failure so the bucket keeps draining
+            removed = future.exception() is None and future.result()
+
+            with buckets_changed:
+                success_count += removed
+                pending = buckets.get(bucket)
+                if pending and not stopped:
+                    queued -= 1
+                    # Submitted under the lock, so the pool cannot be shut
+                    # down between the stop check and the submit
+                    submit(bucket, pending.popleft())
                 else:
-                    failure_count += 1
+                    buckets.pop(bucket, None)
+                buckets_changed.notify_all()
+
+        # Deletions are independent network round-trips, so they can be
+        # issued concurrently over the shared (thread-safe) client
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            try:
+                for lock in locks:
+                    total += 1
+                    bucket = _resource_group_of(_scope_key(lock))
+
+                    with buckets_changed:
+                        # Wait for room in the queue of an active bucket, or
+                        # for a free slot to start a new one
+                        buckets_changed.wait_for(
+                            lambda: (
+                                queued < max_queued
+                                if bucket in buckets
+                                else len(buckets) < self.max_workers
+                            )
+                        )
+                        if bucket in buckets:
+                            buckets[bucket].append(lock)
+                            queued += 1
+                            continue
+                        buckets[bucket] = deque()
+
+                    submit(bucket, lock)
+
+                # Queued locks are submitted from done callbacks, so the pool
+                # may only shut down once every bucket has drained
+                with buckets_changed:
+                    buckets_changed.wait_for(lambda: not buckets)
+            finally:
+                # Buckets are only left over when the listing failed or the
+                # run was interrupted; let running removals finish, but drop
+                # the queued ones before the pool shuts down
+                with buckets_changed:
+                    if buckets:
+                        stopped = True
+                        self.logger.warning(
+                            "Stopping early: %d queued locks were not removed",
+                            queued,
+                        )
+                        buckets.clear()
+
+        return total, success_count
+
+    def remove_all_locks_batched(self) -> dict:
+        """
+        Remove all management locks in the subscription using ARM batch requests.
+
+        Locks are sorted by scope so that each batch holds the locks of a
+        single resource group, and a summary is logged per resource group.
+        Up to ``BATCH_SIZE`` deletions are sent in a single HTTP request.
+        Sub-requests that are throttled or hit a transient server error are
+        sent again in the next batch once their Retry-After has passed; locks
+        that still fail are retried individually with ``remove_lock``.
+
+        Returns:
+            Dictionary with operation summary
+        """
+        if self.dry_run:
+            return self.remove_all_locks()
+
+        total = 0
+        success_count = 0
+
+        locks = sorted(self.iter_locks(), key=_scope_key)
+
+        with self._claim_scope():
+            for rg_name, group in groupby(
+                locks, key=lambda lock: _resource_group_of(_scope_key(lock))
+            ):
+                group_locks = list(group)
+                group_total = len(group_locks)
+                group_success = self._remove_in_batches(group_locks)
+
+                self.logger.info(
+                    "Resource group %s: %d of %d locks removed",
+                    rg_name or "(subscription)",
+                    group_success,
+                    group_total,
+                )
+                total += group_total
+                success_count += group_success
+
+        if total == 0:
+            self.logger.info("No management locks found in subscription")
+            return {"total": 0, "success": 0, "failed": 0}
+
+        self.logger.info("Found %d management locks", total)
+        return self._summarize(total, success_count)
+
+    def _remove_in_batches(self, locks: List[Any]) -> int:
+        """
+        Delete locks in batches of up to ``BATCH_SIZE``.
+
+        Locks whose sub-request should be retried are carried over to the
+        front of the next batch, which is only sent once the longest
+        Retry-After of those sub-requests has passed.
+
+        Returns:
+            Number of locks removed successfully
+        """
+        success_count = 0
+        remaining = iter(locks)
+        carried_over: List[Any] = []
+        retried: Set[str] = set()
+
+        while True:
+            batch = carried_over + list(
+                islice(remaining, BATCH_SIZE - len(carried_over))
+            )
+            if not batch:
+                return success_count
+
+            removed, carried_over, delay = self._remove_batch(batch, retried)
+            success_count += removed
+
+            if carried_over:
+                self.logger.info(
+                    "Waiting %.1f seconds before retrying %d throttled locks",
+                    delay,
+                    len(carried_over),
+                )
+                time.sleep(delay)
 
-            # Summary
-            action = "would be removed" if self.dry_run else "removed"
-            self.logger.info(f"Summary: {success_count} locks {action} successfully")
+    def _remove_batch(
+        self, locks: List[Any], retried: Set[str]
+    ) -> Tuple[int, List[Any], float]:
+        """
+        Delete a batch of locks with one ARM batch request.
 
-            if failure_count > 0:
-                self.logger.warning(f"{failure_count} locks failed to be removed")
+        Args:
+            locks: Locks to delete
+            retried: IDs of locks already carried over once; updated in place
 
-            return {
-                "total": len(locks),
-                "success": success_count,
-                "failed": failure_count,
+        Returns:
+            Tuple of (number of locks removed successfully, locks to send
+            again in the next batch, seconds to wait before sending them)
+        """
+        sub_requests = [
+            {
+                "httpMethod": "DELETE",
+                "url": f"{ARM_ENDPOINT}{lock.id}?api-version={LOCKS_API_VERSION}",
+                "name": str(index),
             }
+            for index, lock in enumerate(locks)
+        ]
+
+        self.logger.info("Removing %d locks in one batch request...", len(locks))
+
+        try:
+            response = self.auth_manager.send_request(
+                HttpRequest("POST", BATCH_URL, json={"requests": sub_requests})
+            )
+            response.raise_for_status()
+            if response.status_code == 202:
+                # Accepted for asynchronous processing: there are no
+                # sub-responses to read, so each lock is checked on its own
+                self.logger.warning(
+                    "Batch request accepted without results. "
+                    "Falling back to single requests"
+                )
+                results = {}
+            else:
+                results = {
+                    item.get("name"): item
+                    for item in response.json().get("responses", [])
+                }
+        except (HttpResponseError, ValueError) as e:
+            # ValueError covers an empty or malformed response body
+            self.logger.warning(
+                "Batch request failed: %s. Falling back to single requests", e
+            )
+            results = {}
+
+        success_count = 0
+        carried_over = []
+        delay = 0.0
+        for index, lock in enumerate(locks):
+            result = results.get(str(index), {})
+            status = result.get("httpStatusCode")
+
+            if status == 404:
+                self.logger.warning(
+                    "Lock %s not found (may have been removed already)", lock.name
+                )
+                success_count += 1
+            elif status is not None and 200 <= status < 300:
+                self.logger.info("Successfully removed lock: %s", lock.name)
+                success_count += 1
+            elif status in RETRYABLE_STATUS_CODES and lock.id not in retried:
+                self.logger.info(
+                    "Batch removal of lock %s returned status %s, "
+                    "retrying in the next batch",
+                    lock.name,
+                    status,
+                )
+                retried.add(lock.id)
+                carried_over.append(lock)
+                retry_after = _retry_after(result)
+                delay = max(
+                    delay,
+                    BATCH_RETRY_DELAY if retry_after is None else retry_after,
+                )
+            else:
+                self.logger.warning(
+                    "Batch removal of lock %s returned status %s, "
+                    "retrying with a single request",
+                    lock.name,
+                    status,
+                )
+                success_count += self.remove_lock(lock)
+
+        return success_count, carried_over, min(delay, BATCH_RETRY_DELAY_MAX)
+
+    def _summarize(self, total: int, success_count: int) -> dict:
+        """Log and return the operation summary."""
+        failure_count = total - success_count
+
+        action = "would be removed" if self.dry_run else "removed"
+        self.logger.info("Summary: %d locks %s successfully", success_count, action)
+
+        if failure_count > 0:
+            self.logger.warning("%d locks failed to be removed", failure_count)
+
+        return {
+            "total": total,
+            "success": success_count,
+            "failed": failure_count,
+        }
 
-        except Exception as e:
-            self.logger.error(f"Failed to remove locks: {e}")
+    @property
+    def _async_auth(self) -> AsyncAzureAuthManager:
+        """Get the async authentication manager, failing if none was configured."""
+        if self.async_auth_manager is None:
+            raise AzureClientError("Async authentication manager not configured")
+        return self.async_auth_manager
+
+    async def iter_locks_async(self) -> AsyncIterator[Any]:
+        """
+        Iterate over all management locks in the subscription using the async client.
+
+        Yields:
+            ManagementLockObject instances
+        """
+        self.logger.info("Retrieving management locks from subscription...")
+
+        try:
+            management_locks = self._async_auth.management_locks
+            async for lock in management_locks.list_at_subscription_level():
+                yield lock
+        except ResourceNotFoundError:
+            self.logger.warning("Subscription not found or no access")
+        except Exception:
+            self.logger.exception("Error while listing locks")
             raise
+
+    async def list_locks_async(self) -> List[Any]:
+        """
+        List all management locks in the subscription using the async client.
+
+        Returns:
+            List of ManagementLockObject instances
+        """
+        locks = [lock async for lock in self.iter_locks_async()]
+        self.logger.info("Found %d management locks", len(locks))
+        return locks
+
+    async def remove_lock_async(self, lock: Any) -> bool:
+        """
+        Remove a specific management lock using the async client.
+
+        Args:
+            lock: ManagementLockObject to remove
+
+        Returns:
+            True if successful, False otherwise
+        """
+        lock_name = lock.name
+
+        if self.dry_run:
+            self.logger.info(
+                "[DRY RUN] Would remove lock: %s (id: %s)", lock_name, lock.id
+            )
+            return True
+
+        try:
+            if self._async_auth.breaker.is_open():
+                self.logger.warning(
+                    "Circuit breaker open after repeated throttling, skipping lock %s",
+                    lock_name,
+                )
+                return False
+
+            if not self._claim(lock):
+                self.logger.debug("Lock %s already removed, skipping", lock_name)
+                return True
+
+            self.logger.info("Removing lock: %s (id: %s)", lock_name, lock.id)
+
+            await self._execute_delete(lock, self._async_auth.management_locks)
+
+            self.logger.info("Successfully removed lock: %s", lock_name)
+            return True
+
+        except ResourceNotFoundError:
+            self.logger.warning(
+                "Lock %s not found (may have been removed already)", lock_name
+            )
+            return True
+        except HttpResponseError as e:
+            self._release(lock)
+            if e.status_code == 403:
+                self.logger.error(
+                    "Insufficient permissions to remove lock: %s", lock_name
+                )
+            else:
+                self.logger.error("HTTP error removing lock %s: %s", lock_name, e)
+            return False
+        except Exception:
+            self._release(lock)
+            self.logger.exception("Unexpected error removing lock %s", lock_name)
+            return False
+
+    async def remove_all_locks_async(self) -> dict:
+        """
+        Remove all management locks in the subscription using the async client.
+
+        A producer streams the paged listing into a bounded queue that
+        ``max_concurrency`` workers consume, so at most
+        ``max_concurrency * 2`` locks are held in memory and at most
+        ``max_concurrency`` requests are in flight.
+
+        Returns:
+            Dictionary with operation summary
+        """
+        async with self._async_auth:
+            if self.dry_run:
+                total = 0
+                async for lock in self.iter_locks_async():
+                    self._report_lock(lock)
+                    total += 1
+                success_count = total
+            else:
+                with self._claim_scope():
+                    total, success_count = await self._remove_streamed_async()
+
+        if total == 0:
+            self.logger.info("No management locks found in subscription")
+            return {"total": 0, "success": 0, "failed": 0}
+
+        self.logger.info("Found %d management locks", total)
+        return self._summarize(total, success_count)
+
+    async def _remove_streamed_async(self) -> Tuple[int, int]:
+        """
+        Remove locks as the async listing produces them.
+
+        Returns:
+            Tuple of (total, success_count)
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.max_concurrency * 2)
+
+        producer = asyncio.ensure_future(self._produce_locks(queue))
+        results = await asyncio.gather(
+            *(self._consume_locks(queue) for _ in range(self.max_concurrency))
+        )
+        # Re-raise a listing failure once the workers have drained
+        await producer
+
+        return (
+            sum(result[0] for result in results),
+            sum(result[1] for result in results),
+        )
+
+    async def _produce_locks(self, queue: asyncio.Queue) -> None:
+        """Feed the paged listing into the queue, then one stop marker per worker."""
+        try:
+            async for lock in self.iter_locks_async():
+                await queue.put(lock)
+        finally:
+            for _ in range(self.max_concurrency):
+                await queue.put(None)
+
+    async def _consume_locks(self, queue: asyncio.Queue) -> Tuple[int, int]:
+        """
+        Remove locks from the queue until the stop marker is received.
+
+        Returns:
+            Tuple of (total, success_count)
+        """
+        total = 0
+        success_count = 0
+
+        while True:
+            lock = await queue.get()
+            if lock is None:
+                return total, success_count
+
+            success_count += await self.remove_lock_async(lock)
+            total += 1
@@ -3,18 +3,124 @@ Lock scope parsing utilities
 """
 
 import logging
-from typing import Dict, Any
+import re
+from functools import lru_cache
+from typing import Dict, Tuple
 
 from .exceptions import InvalidScopeError
 
+logger = logging.getLogger(__name__)
+
+# Format: /subscriptions/{sub-id}[/resourcegroups/{rg-name}
+#         [/providers/{provider}/{resource-type}/{resource-name}]]
+_SCOPE_RE = re.compile(
+    r"^/subscriptions/[^/]+"
+    r"(?:/resourcegroups/(?P<rg>[^/]+)"
+    r"(?:/providers/(?P<prov>[^/]+)/(?P<rtype>[^/]+)/(?P<rname>.+?))?)?/?$",
+    re.IGNORECASE,
+)
+
+# Separator between a lock's scope and its name in the lock resource ID
+# Format: {scope}/providers/Microsoft.Authorization/locks/{lock-name}
+LOCK_PATH_SEGMENT = "/providers/Microsoft.Authorization/locks/"
+_LOCK_PATH_SEGMENT_LOWER = LOCK_PATH_SEGMENT.lower()
+
+
+@lru_cache(maxsize=4096)
+def parse_lock_scope(lock_scope: str) -> Tuple[str, ...]:
+    """
+    Parse a lock scope to determine its type and extract relevant information.
+
+    Results are memoized, since many locks usually share the same resource
+    group or resource scope.
+
+    Args:
+        lock_scope: The lock scope string
+
+    Returns:
+        One of ``("subscription",)``, ``("resource_group", rg_name)`` or
+        ``("resource", rg_name, provider, resource_type, resource_name)``
+
+    Raises:
+        InvalidScopeError: If the scope cannot be parsed
+    """
+    match = _SCOPE_RE.match(lock_scope)
+
+    if match is None:
+        logger.error(f"Failed to parse lock scope: {lock_scope}")
+        raise InvalidScopeError(f"Invalid lock scope format: {lock_scope}")
+
+    if match.group("rg") is None:
+        # Subscription scoped lock
+        return ("subscription",)
+    if match.group("prov") is None:
+        # Resource group scoped lock
+        return ("resource_group", match.group("rg"))
+
+    # Resource scoped lock; the resource name may span several segments
+    return ("resource",) + match.group("rg", "prov", "rtype", "rname")
+
+
+def split_lock_id(lock_id: str) -> Tuple[str, str]:
+    """
+    Split a lock resource ID into its scope and lock name.
+
+    Resource IDs are case-insensitive, so the lock path segment is matched in
+    any case.
+
+    Args:
+        lock_id: The lock resource ID
+
+    Returns:
+        Tuple of (scope, lock name); the scope is empty if the ID has no lock
+        path segment
+    """
+    scope, separator, lock_name = lock_id.rpartition(LOCK_PATH_SEGMENT)
+
+    if not separator:
+        index = lock_id.lower().rfind(_LOCK_PATH_SEGMENT_LOWER)
+        if index != -1:
+            scope = lock_id[:index]
+            lock_name = lock_id[index + len(LOCK_PATH_SEGMENT) :]
+
+    return scope, lock_name
+
+
+def parse_lock_id(lock_id: str) -> Tuple[str, ...]:
+    """
+    Parse the scope of a lock directly from its full resource ID.
+
+    The scope is split off the lock name with :func:`split_lock_id` and
+    parsed by the cached :func:`parse_lock_scope`, so locks sharing a scope
+    are parsed once.
+
+    Args:
+        lock_id: The lock resource ID
+
+    Returns:
+        The same scope tuple as :func:`parse_lock_scope`
+
+    Raises:
+        InvalidScopeError: If the lock ID cannot be parsed
+    """
+    scope, lock_name = split_lock_id(lock_id)
+
+    if not scope or not lock_name.rstrip("/") or "/" in lock_name.rstrip("/"):
+        logger.error(f"Failed to parse lock ID: {lock_id}")
+        raise InvalidScopeError(f"Invalid lock ID format: {lock_id}")
+
+    return parse_lock_scope(scope)
+
 
 class LockScopeParser:
     """Handles parsing of Azure management lock scopes."""
 
-    def __init__(self):
+    __slots__ = ("logger",)
+
+    def __init__(self) -> None:
         self.logger = logging.getLogger(__name__)
 
-    def parse_lock_scope(self, lock_scope: str) -> Dict[str, Any]:
+    def parse_lock_scope(self, lock_scope: str) -> Dict[str, str]:
         """
         Parse a lock scope to determine its type and extract relevant information.
 
@@ -27,81 +133,18 @@ class LockScopeParser:
         Raises:
             InvalidScopeError: If the scope cannot be parsed
         """
-        try:
-            scope_lower = lock_scope.lower()
-
-            if "/resourcegroups/" in scope_lower:
-                return self._parse_resource_group_or_resource_scope(
-                    lock_scope, scope_lower
-                )
-            else:
-                return self._parse_subscription_scope(lock_scope)
-
-        except Exception as e:
-            self.logger.error(f"Failed to parse lock scope: {lock_scope}")
-            raise InvalidScopeError(f"Invalid lock scope format: {lock_scope}") from e
-
-    def _parse_resource_group_or_resource_scope(
-        self, lock_scope: str, scope_lower: str
-    ) -> Dict[str, Any]:
-        """Parse resource group or resource-level lock scopes."""
-        # Find the position of "resourcegroups" in the original scope
-        rg_index = scope_lower.find("/resourcegroups/")
-        if rg_index == -1:
-            raise ValueError(f"Could not find resourcegroups in scope: {lock_scope}")
-
-        # Extract everything after "/resourcegroups/"
-        after_rg = lock_scope[rg_index + len("/resourcegroups/") :]
-
-        if "/providers/" not in after_rg:
-            # Resource group scoped lock
-            # Format: /subscriptions/{sub-id}/resourcegroups/{rg-name}
-            rg_name = after_rg.rstrip("/")  # Remove trailing slash if present
-            return {"type": "resource_group", "resource_group_name": rg_name}
-        else:
-            # Resource scoped lock
-            # Format: /subscriptions/{sub-id}/resourcegroups/{rg-name}/
-            # providers/{provider}/{resource-type}/{resource-name}
-            return self._parse_resource_scope(lock_scope, after_rg)
-
-    def _parse_resource_scope(self, lock_scope: str, after_rg: str) -> Dict[str, Any]:
-        """Parse resource-level lock scope."""
-        # Need at least: rg-name, providers, provider-name, resource-type
-        parts = after_rg.split("/")
-        if len(parts) < 4:
-            raise ValueError(f"Invalid resource lock scope format: {lock_scope}")
-
-        rg_name = parts[0]
-
-        # Find "providers" in the parts
-        try:
-            providers_index = next(
-                i for i, part in enumerate(parts) if part.lower() == "providers"
-            )
-        except StopIteration:
-            raise ValueError(f"Could not find providers in scope: {lock_scope}")
-
-        if providers_index + 2 >= len(parts):
-            raise ValueError(f"Invalid provider format in scope: {lock_scope}")
-
-        provider = parts[providers_index + 1]
-        resource_type = parts[providers_index + 2]
-
-        # Resource name could be the next part or multiple parts combined
-        if providers_index + 3 < len(parts):
-            resource_name = "/".join(parts[providers_index + 3 :])
+        scope = parse_lock_scope(lock_scope)
+
+        if scope[0] == "resource_group":
+            return {"type": "resource_group", "resource_group_name": scope[1]}
+        elif scope[0] == "resource":
+            _, rg_name, provider, resource_type, resource_name = scope
+            return {
+                "type": "resource",
+                "resource_group_name": rg_name,
+                "provider": provider,
+                "resource_type": resource_type,
+                "resource_name": resource_name,
+            }
         else:
-            raise ValueError(f"Could not find resource name in scope: {lock_scope}")
-
-        return {
-            "type": "resource",
-            "resource_group_name": rg_name,
-            "provider": provider,
-            "resource_type": resource_type,
-            "resource_name": resource_name,
-        }
-
-    def _parse_subscription_scope(self, lock_scope: str) -> Dict[str, Any]:
-        """Parse subscription-level lock scope."""
-        # Format: /subscriptions/{sub-id}
-        return {"type": "subscription"}
+            return {"type": "subscription"}
@@ -0,0 +1,276 @@
+"""
+Azure Core pipeline policies
+"""
+
+import asyncio
+import secrets
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from azure.core.pipeline import PipelineRequest, PipelineResponse
+from azure.core.pipeline.policies import (
+    AsyncHTTPPolicy,
+    AsyncRetryPolicy,
+    HTTPPolicy,
+    RetryPolicy,
+    SansIOHTTPPolicy,
+)
+
+# Backoff randomization of +/-20%, matching Azure's
+# RandomizedExponentialBackoffStrategy
+JITTER_FACTOR = 0.2
+
+# Only these statuses are retried, with or without a Retry-After header;
+# anything else (e.g. 403, 404) is returned to the caller immediately
+RETRYABLE_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+
+# Exponent cap for the backoff, so repeated failures never sleep longer than
+# backoff_factor * 2**6 (still bounded by retry_backoff_max)
+MAX_BACKOFF_EXPONENT = 6
+
+# Requests that can be sent back-to-back before the rate limit applies
+RATE_LIMIT_BURST = 20
+
+# Methods that do not count against the client-side rate limit; ARM write
+# limits are far lower than its read limits
+_READ_METHODS = frozenset({"GET", "HEAD"})
+
+# Consecutive throttled responses that open the circuit breaker, and how long
+# it stays open before requests are let through again
+BREAKER_THRESHOLD = 20
+BREAKER_COOLDOWN = 30.0
+
+# Statuses counted as throttling by the circuit breaker
+_THROTTLE_STATUS_CODES = frozenset({429, 503})
+
+# Extra retries allowed for throttled (429) responses, which do not consume
+# the regular retry budget
+THROTTLED_RETRIES = 10
+
+
+def _is_throttled(response: Any) -> bool:
+    """Check whether a pipeline response is an HTTP 429."""
+    return (
+        isinstance(response, PipelineResponse)
+        and response.http_response.status_code == 429
+    )
+
+
+class _JitteredBackoffMixin:
+    """Randomizes the exponential backoff of an Azure Core retry policy."""
+
+    def __init__(self, **kwargs: Any) -> None:
+        self.throttled_retries: int = kwargs.pop("retry_throttled", THROTTLED_RETRIES)
+        super().__init__(**kwargs)
+
+    def configure_retries(self, options: Dict[str, Any]) -> Dict[str, Any]:
+        settings = super().configure_retries(options)
+        settings["throttled"] = options.pop("retry_throttled", self.throttled_retries)
+        return settings
+
+    def increment(
+        self,
+        settings: Dict[str, Any],
+        response: Optional[Any] = None,
+        error: Optional[Exception] = None,
+    ) -> bool:
+        """
+        Increment the retry counters.
+
+        Throttled responses are soft failures: while the throttle budget
+        lasts they are refunded from the regular retry counters.
+        """
+        if _is_throttled(response) and settings["throttled"] > 0:
+            settings["throttled"] -= 1
+            settings["total"] += 1
+            settings["status"] += 1
+        return super().increment(settings, response=response, error=error)
+
+    def is_retry(self, settings: Dict[str, Any], response: Any) -> bool:
+        """Only retry transient statuses, even when Retry-After is present."""
+        if response.http_response.status_code not in RETRYABLE_STATUS_CODES:
+            return False
+        return super().is_retry(settings, response)
+
+    def get_backoff_time(self, settings: Dict[str, Any]) -> float:
+        """
+        Return the exponential backoff with jitter applied.
+
+        Concurrent workers that fail together would otherwise all retry at
+        the same instant; the jitter spreads their retries out.
+        """
+        consecutive_errors = len(settings["history"])
+        if consecutive_errors <= 1:
+            return 0
+
+        exponent = min(consecutive_errors - 1, MAX_BACKOFF_EXPONENT)
+        backoff = settings["backoff"] * (2**exponent)
+        # randbits(16) / 65535 is uniform in [0, 1]
+        jitter = (secrets.randbits(16) / 65535 - 0.5) * 2 * JITTER_FACTOR
+        return min(settings["max_backoff"], backoff * (1 + jitter))
+
+    def _get_delay(self, settings: Dict[str, Any], response: Optional[Any]) -> float:
+        """Return the longer of the backoff and the server's Retry-After."""
+        backoff = self.get_backoff_time(settings)
+        retry_after = self.get_retry_after(response) if response else None
+        return max(backoff, retry_after or 0)
+
+
+class JitteredRetryPolicy(_JitteredBackoffMixin, RetryPolicy):
+    """Retry policy with randomized exponential backoff."""
+
+    def sleep(self, settings, transport, response=None) -> None:
+        """Sleep for the backoff, or longer if the server sent Retry-After."""
+        delay = self._get_delay(settings, response)
+        if delay > 0:
+            transport.sleep(delay)
+
+
+class AsyncJitteredRetryPolicy(_JitteredBackoffMixin, AsyncRetryPolicy):
+    """Async retry policy with randomized exponential backoff."""
+
+    async def sleep(self, settings, transport, response=None) -> None:
+        """Sleep for the backoff, or longer if the server sent Retry-After."""
+        delay = self._get_delay(settings, response)
+        if delay > 0:
+            await transport.sleep(delay)
+
+
+class TokenBucket:
+    """Thread-safe token bucket used to pace requests."""
+
+    def __init__(self, rate: float, burst: int = RATE_LIMIT_BURST):
+        """
+        Initialize the token bucket.
+
+        Args:
+            rate: Tokens added per second
+            burst: Maximum number of tokens the bucket holds
+        """
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Take one token from the bucket.
+
+        Returns:
+            Seconds the caller must wait before the token may be used
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            return max(0.0, -self._tokens / self.rate)
+
+
+class RateLimitPolicy(HTTPPolicy):
+    """
+    Paces write requests through a token bucket.
+
+    Added as a per-retry policy, so every attempt, including retries, takes a
+    token.
+    """
+
+    def __init__(self, bucket: TokenBucket):
+        super().__init__()
+        self._bucket = bucket
+
+    def send(self, request: PipelineRequest) -> PipelineResponse:
+        if request.http_request.method not in _READ_METHODS:
+            delay = self._bucket.reserve()
+            if delay > 0:
+                time.sleep(delay)
+        return self.next.send(request)
+
+
+class AsyncRateLimitPolicy(AsyncHTTPPolicy):
+    """Async counterpart of :class:`RateLimitPolicy`."""
+
+    def __init__(self, bucket: TokenBucket):
+        super().__init__()
+        self._bucket = bucket
+
+    async def send(self, request: PipelineRequest) -> PipelineResponse:
+        if request.http_request.method not in _READ_METHODS:
+            delay = self._bucket.reserve()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        return await self.next.send(request)
+
+
+class CircuitBreaker:
+    """
+    Thread-safe circuit breaker for sustained throttling.
+
+    The breaker opens after ``fail_threshold`` consecutive throttled
+    responses and stays open for ``cooldown`` seconds. After the cool-down
+    requests are let through again; one more throttled response reopens it,
+    while any successful response closes it.
+    """
+
+    def __init__(
+        self,
+        fail_threshold: int = BREAKER_THRESHOLD,
+        cooldown: float = BREAKER_COOLDOWN,
+    ):
+        """
+        Initialize the circuit breaker.
+
+        Args:
+            fail_threshold: Consecutive throttled responses that open the breaker
+            cooldown: Seconds the breaker stays open
+        """
+        self.fail_threshold = fail_threshold
+        self.cooldown = cooldown
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def is_open(self) -> bool:
+        """Check whether requests should currently fail fast."""
+        with self._lock:
+            return (
+                self._opened_at is not None
+                and time.monotonic() - self._opened_at < self.cooldown
+            )
+
+    def record_failure(self) -> None:
+        """Record a throttled response, opening the breaker at the threshold."""
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.fail_threshold:
+                self._opened_at = time.monotonic()
+
+    def record_success(self) -> None:
+        """Record a successful response, closing the breaker."""
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+
+
+class CircuitBreakerPolicy(SansIOHTTPPolicy):
+    """
+    Feeds response statuses into a circuit breaker.
+
+    Added as a per-retry policy, so throttled retries are counted as well.
+    Works in both sync and async pipelines.
+    """
+
+    def __init__(self, breaker: CircuitBreaker):
+        super().__init__()
+        self._breaker = breaker
+
+    def on_response(self, request: PipelineRequest, response: PipelineResponse) -> None:
+        status = response.http_response.status_code
+        if status in _THROTTLE_STATUS_CODES:
+            self._breaker.record_failure()
+        elif status < 500:
+            self._breaker.record_success()
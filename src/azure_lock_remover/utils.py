@@ -2,14 +2,63 @@
 Configuration and utilities
 """
 
+import json
 import logging
+import re
+import sys
+from datetime import datetime, timezone
+from typing import Optional
 
+LOG_FORMATS = ("text", "json")
 
-def setup_logging(log_level: str) -> None:
-    """Configure logging with the specified level."""
+_GUID_RE = re.compile(
+    r"\A[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\Z"
+)
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats log records as single-line JSON objects."""
+
+    def formatTime(
+        self, record: logging.LogRecord, datefmt: Optional[str] = None
+    ) -> str:
+        """Return the record time as ISO 8601 in UTC, with milliseconds."""
+        created = datetime.fromtimestamp(record.created, timezone.utc)
+        return created.isoformat(timespec="milliseconds")
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Serialize the record's time, level, logger name and message."""
+        entry = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry)
+
+
+def setup_logging(log_level: str, log_format: str = "text") -> None:
+    """
+    Configure logging with the specified level and format.
+
+    Args:
+        log_level: Logging level name
+        log_format: ``"text"`` for human-readable output on stderr, or
+            ``"json"`` for one JSON object per line on stdout
+    """
     numeric_level = getattr(logging, log_level.upper(), None)
     if not isinstance(numeric_level, int):
         raise ValueError(f"Invalid log level: {log_level}")
+    if log_format not in LOG_FORMATS:
+        raise ValueError(f"Invalid log format: {log_format}")
+
+    if log_format == "json":
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(JsonFormatter())
+        logging.basicConfig(level=numeric_level, handlers=[handler])
+        return
 
     logging.basicConfig(
         level=numeric_level,
@@ -28,4 +77,4 @@ def validate_subscription_id(subscription_id: str) -> bool:
     Returns:
         True if valid format, False otherwise
     """
-    return len(subscription_id) == 36 and subscription_id.count("-") == 4
+    return _GUID_RE.match(subscription_id) is not None
@@ -22,11 +22,17 @@ Authentication:
 """
 
 import argparse
+import asyncio
 import logging
 import sys
 
 from azure_lock_remover import AzureLockRemover
-from azure_lock_remover.utils import setup_logging, validate_subscription_id
+from azure_lock_remover.operations import DEFAULT_MAX_CONCURRENCY
+from azure_lock_remover.utils import (
+    LOG_FORMATS,
+    setup_logging,
+    validate_subscription_id,
+)
 
 
 def main():
@@ -39,6 +45,11 @@ Examples:
   %(prog)s --subscription-id 12345678-1234-1234-1234-123456789012
   %(prog)s --subscription-id 12345678-1234-1234-1234-123456789012 --dry-run
   %(prog)s --subscription-id 12345678-1234-1234-1234-123456789012 --log-level DEBUG
+  %(prog)s --subscription-id 12345678-1234-1234-1234-123456789012 --log-format json
+  %(prog)s --subscription-id 12345678-1234-1234-1234-123456789012 --max-workers 32
+  %(prog)s --subscription-id 12345678-1234-1234-1234-123456789012 --async --max-concurrency 128
+  %(prog)s --subscription-id 12345678-1234-1234-1234-123456789012 --batch
+  %(prog)s --subscription-id 12345678-1234-1234-1234-123456789012 --rate-limit 200
 
 Authentication:
   The script uses DefaultAzureCredential which supports:
@@ -68,10 +79,56 @@ Required Permissions:
         help="Logging level (default: INFO)",
     )
 
+    parser.add_argument(
+        "--log-format",
+        choices=LOG_FORMATS,
+        default="text",
+        help="Log output format; json writes one object per line to stdout "
+        "(default: text)",
+    )
+
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=16,
+        help="Maximum number of locks removed concurrently (default: 16)",
+    )
+
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=None,
+        help="Maximum number of concurrent deletions; sizes the thread pool, "
+        "or the in-flight deletions with --async "
+        f"(default: --max-workers, or {DEFAULT_MAX_CONCURRENCY} with --async)",
+    )
+
+    parser.add_argument(
+        "--rate-limit",
+        type=float,
+        default=None,
+        help="Maximum delete requests per minute, e.g. 200 (default: no limit)",
+    )
+
+    mode = parser.add_mutually_exclusive_group()
+
+    mode.add_argument(
+        "--async",
+        dest="use_async",
+        action="store_true",
+        help="Remove locks on a single event loop using the async Azure SDK",
+    )
+
+    mode.add_argument(
+        "--batch",
+        action="store_true",
+        help="Remove locks with ARM batch requests (up to 20 per request)",
+    )
+
     args = parser.parse_args()
 
     # Setup logging
-    setup_logging(args.log_level)
+    setup_logging(args.log_level, args.log_format)
     logger = logging.getLogger(__name__)
 
     try:
@@ -80,15 +137,44 @@ Required Permissions:
             logger.error("Invalid subscription ID format. Expected GUID format.")
             sys.exit(1)
 
+        if args.max_workers < 1:
+            logger.error("Invalid --max-workers value. Expected a positive integer.")
+            sys.exit(1)
+
+        if args.max_concurrency is not None and args.max_concurrency < 1:
+            logger.error(
+                "Invalid --max-concurrency value. Expected a positive integer."
+            )
+            sys.exit(1)
+
+        if args.rate_limit is not None and args.rate_limit <= 0:
+            logger.error("Invalid --rate-limit value. Expected a positive number.")
+            sys.exit(1)
+
+        # --max-concurrency sizes whichever mode runs
+        max_workers = args.max_workers
+        max_concurrency = DEFAULT_MAX_CONCURRENCY
+        if args.max_concurrency is not None:
+            max_workers = max_concurrency = args.max_concurrency
+
         # Initialize and run lock remover
         remover = AzureLockRemover(
-            subscription_id=args.subscription_id, dry_run=args.dry_run
+            subscription_id=args.subscription_id,
+            dry_run=args.dry_run,
+            max_workers=max_workers,
+            max_concurrency=max_concurrency,
+            rate_limit=args.rate_limit,
         )
 
         if args.dry_run:
             logger.info("Running in DRY RUN mode - no locks will be removed")
 
-        result = remover.remove_all_locks()
+        if args.use_async:
+            result = asyncio.run(remover.remove_all_locks_async())
+        elif args.batch:
+            result = remover.remove_all_locks_batched()
+        else:
+            result = remover.remove_all_locks()
 
         # Log final summary
         if result["total"] == 0:
@@ -96,8 +182,10 @@ Required Permissions:
         else:
             action = "would be processed" if args.dry_run else "processed"
             logger.info(
-                f"Lock removal completed: {result['success']}/{result['total']} "
-                f"locks {action} successfully"
+                "Lock removal completed: %d/%d locks %s successfully",
+                result["success"],
+                result["total"],
+                action,
             )
 
         logger.info("Lock removal process completed successfully")